@@ -1,7 +1,10 @@
 import os
-import math
 import time
+import heapq
+import logging
 import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 
@@ -9,193 +12,424 @@ import numpy as np
 import pandas as pd
 import requests
 
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is optional
+    njit = None
+
 TWELVE_DATA_API_KEY = os.getenv("TWELVE_DATA_API_KEY", "")
 _TWELVE_BASE = "https://api.twelvedata.com"
 
+logger = logging.getLogger("signalradar")
+logger.addHandler(logging.NullHandler())
+
 _session = requests.Session()
 _session.headers.update({"User-Agent": "SignalRadar/1.0"})
+# The default adapter keeps only 10 pooled connections per host; with up to
+# 32 fetch workers the extras get discarded after each request and lose
+# keep-alive. Size the pool to the worker cap so warm connections persist.
+_adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=32)
+_session.mount("https://", _adapter)
+_session.mount("http://", _adapter)
 
 # Rate limiter: max 7 calls/60s (leave 1 buffer under free-tier limit of 8)
 _call_timestamps: List[float] = []
 _RATE_LIMIT = 7
 _RATE_WINDOW = 61.0
+_rate_lock = threading.Lock()
 
-# In-memory cache: ticker_days -> (DataFrame, expires_at)
+# In-memory cache: TICKER_days -> (DataFrame, expires_at)
 _df_cache: Dict[str, tuple] = {}
+_cache_lock = threading.Lock()
 _CACHE_TTL = 600  # 10 minutes
 
 
-def _rate_limited_get(url: str, params: dict) -> requests.Response:
-    global _call_timestamps
-    now = time.time()
-    _call_timestamps = [t for t in _call_timestamps if now - t < _RATE_WINDOW]
-    if len(_call_timestamps) >= _RATE_LIMIT:
-        wait = _RATE_WINDOW - (now - _call_timestamps[0]) + 0.1
-        if wait > 0:
-            print(f"[RATE] sleeping {wait:.1f}s")
-            time.sleep(wait)
-        _call_timestamps = [t for t in _call_timestamps if time.time() - t < _RATE_WINDOW]
-    resp = _session.get(url, params=params, timeout=20)
-    _call_timestamps.append(time.time())
-    return resp
+def _cache_get(ticker: str, days: int) -> Optional[pd.DataFrame]:
+    with _cache_lock:
+        entry = _df_cache.get(f"{ticker.upper()}_{days}")
+    if entry is None:
+        return None
+    df, expires = entry
+    if datetime.now() >= expires:
+        return None
+    return df
+
+
+def _cache_put(ticker: str, days: int, df: pd.DataFrame) -> None:
+    with _cache_lock:
+        _df_cache[f"{ticker.upper()}_{days}"] = (df, datetime.now() + timedelta(seconds=_CACHE_TTL))
+
+
+def _rate_limited_get(url: str, params: dict, credits: int = 1) -> requests.Response:
+    # Reserve a slot under the lock, then do the HTTP call outside it so
+    # concurrent fetches don't serialize on the network round-trip. A
+    # multi-symbol request costs one upstream credit per symbol.
+    slots = min(credits, _RATE_LIMIT)
+    while True:
+        with _rate_lock:
+            now = time.time()
+            _call_timestamps[:] = [t for t in _call_timestamps if now - t < _RATE_WINDOW]
+            if len(_call_timestamps) + slots <= _RATE_LIMIT:
+                _call_timestamps.extend([now] * slots)
+                break
+            wait = _RATE_WINDOW - (now - _call_timestamps[0]) + 0.1
+        logger.info("rate limit: sleeping %.1fs", wait)
+        time.sleep(wait)
+    return _session.get(url, params=params, timeout=20)
 
 
 # -----------------------------
 # Helpers: indicators
 # -----------------------------
 
+if njit is not None:
+    @njit(cache=True, fastmath=True, inline="always")
+    def _rolling_mean_jit(arr, window):
+        n = arr.shape[0]
+        out = np.full(n, np.nan)
+        if n < window:
+            return out
+        running = 0.0
+        for i in range(window):
+            running += arr[i]
+        out[window - 1] = running / window
+        for i in range(window, n):
+            running += arr[i] - arr[i - window]
+            out[i] = running / window
+        return out
+
+    # The indicator windows are compile-time constants, so give each its
+    # own kernel: with the generic body inlined, the JIT folds the window
+    # bound and the 1/W reciprocal per kernel. (Top-level defs rather than
+    # generated closures so cache=True works.)
+    @njit(cache=True, fastmath=True)
+    def _rolling_mean_14(arr):
+        return _rolling_mean_jit(arr, 14)
+
+    @njit(cache=True, fastmath=True)
+    def _rolling_mean_20(arr):
+        return _rolling_mean_jit(arr, 20)
+
+    @njit(cache=True, fastmath=True)
+    def _rolling_mean_50(arr):
+        return _rolling_mean_jit(arr, 50)
+
+    @njit(cache=True, fastmath=True)
+    def _rolling_mean_200(arr):
+        return _rolling_mean_jit(arr, 200)
+
+    _ROLLING_KERNELS = {14: _rolling_mean_14, 20: _rolling_mean_20,
+                        50: _rolling_mean_50, 200: _rolling_mean_200}
+
+    def rolling_mean_nb(arr: np.ndarray, window: int) -> np.ndarray:
+        arr = np.ascontiguousarray(arr, dtype=np.float64)
+        kernel = _ROLLING_KERNELS.get(window)
+        if kernel is not None:
+            return kernel(arr)
+        return _rolling_mean_jit(arr, window)
+
+    # Warm up the JIT once at import so the first request doesn't pay
+    # compilation latency (cache=True loads it from disk on later runs).
+    for _kernel in _ROLLING_KERNELS.values():
+        _kernel(np.zeros(1))
+else:
+    def rolling_mean_nb(arr: np.ndarray, window: int) -> np.ndarray:
+        arr = np.asarray(arr, dtype=np.float64)
+        out = np.full(arr.shape[0], np.nan)
+        if arr.shape[0] >= window:
+            csum = np.concatenate(([0.0], np.cumsum(arr)))
+            out[window - 1:] = (csum[window:] - csum[:-window]) / window
+        return out
+
+
+def _rolling_means_shared(arr: np.ndarray, windows: tuple) -> Dict[int, np.ndarray]:
+    """Rolling means for several window sizes from one shared prefix sum,
+    so the source array is scanned once instead of once per window."""
+    arr = np.asarray(arr, dtype=np.float64)
+    n = arr.shape[0]
+    csum = np.concatenate(([0.0], np.cumsum(arr)))
+    out: Dict[int, np.ndarray] = {}
+    for w in windows:
+        m = np.full(n, np.nan)
+        if n >= w:
+            m[w - 1:] = (csum[w:] - csum[:-w]) / w
+        out[w] = m
+    return out
+
+
 def compute_rsi(close: pd.Series, period: int = 14) -> pd.Series:
-    delta = close.diff()
-    gain = pd.Series(np.where(delta > 0, delta, 0.0), index=close.index)
-    loss = pd.Series(np.where(delta < 0, -delta, 0.0), index=close.index)
-    avg_gain = gain.rolling(window=period, min_periods=period).mean()
-    avg_loss = loss.rolling(window=period, min_periods=period).mean()
-    rs = avg_gain / avg_loss.replace(0, np.nan)
-    return 100 - (100 / (1 + rs))
+    # Pure-NumPy path: prefix sums give the O(N) rolling means without the
+    # intermediate Series allocations of the pandas .rolling() version.
+    arr = close.to_numpy(dtype=np.float64)
+    delta = np.diff(arr)
+    gain = np.maximum(delta, 0.0)
+    loss = np.maximum(-delta, 0.0)
+
+    csum_gain = np.concatenate(([0.0], np.cumsum(gain)))
+    csum_loss = np.concatenate(([0.0], np.cumsum(loss)))
+    avg_gain = (csum_gain[period:] - csum_gain[:-period]) / period
+    avg_loss = (csum_loss[period:] - csum_loss[:-period]) / period
+
+    rsi = np.full(arr.shape, np.nan)
+    with np.errstate(invalid="ignore"):
+        rs = avg_gain / np.where(avg_loss == 0.0, np.nan, avg_loss)
+        rsi[period:] = 100 - (100 / (1 + rs))
+    return pd.Series(rsi, index=close.index)
 
 
 def compute_atr(high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14) -> pd.Series:
-    prev_close = close.shift(1)
-    tr = pd.concat([high - low, (high - prev_close).abs(), (low - prev_close).abs()], axis=1).max(axis=1)
-    return tr.rolling(window=period, min_periods=period).mean()
+    # One fused reduction over three NumPy arrays instead of the
+    # concat-three-Series-then-max-axis-1 pattern.
+    h = high.to_numpy(dtype=np.float64)
+    l = low.to_numpy(dtype=np.float64)
+    pc = np.empty_like(h)
+    pc[0] = np.nan
+    pc[1:] = close.to_numpy(dtype=np.float64)[:-1]
+    tr = np.maximum.reduce([h - l, np.abs(h - pc), np.abs(l - pc)])
+    if tr.size:
+        # Row 0 has no previous close; pandas' max(axis=1) skipped the NaN
+        # legs there, so keep high-low rather than letting NaN poison the
+        # running sum.
+        tr[0] = h[0] - l[0]
+    return pd.Series(rolling_mean_nb(tr, period), index=close.index)
 
 
 # -----------------------------
 # Data fetching
 # -----------------------------
 
+def _build_frame(values: list) -> pd.DataFrame:
+    df = pd.DataFrame(values)
+    df["datetime"] = pd.to_datetime(df["datetime"])
+    df = df.sort_values("datetime").set_index("datetime")
+    for col in ["open", "high", "low", "close", "volume"]:
+        df[col] = pd.to_numeric(df[col], errors="coerce")
+    df = df.rename(columns={"open": "Open", "high": "High", "low": "Low", "close": "Close", "volume": "Volume"})
+    # Partial rows are rare, so fast-path the no-drop case with one NumPy
+    # scan instead of paying dropna's fresh-frame allocation every call.
+    vals = df[["Close", "High", "Low", "Volume"]].to_numpy(dtype=np.float64)
+    mask = ~np.isnan(vals).any(axis=1)
+    if not mask.all():
+        df = df.loc[mask]
+    # float32 halves the footprint of every cached frame; quotes carry at
+    # most ~7 significant digits anyway. Volume keeps its wider dtype.
+    for col in ("Close", "High", "Low", "Open"):
+        df[col] = df[col].astype(np.float32)
+    return df
+
+
+def _add_indicators(df: pd.DataFrame) -> pd.DataFrame:
+    n = len(df)
+    # Only compute MAs whose window fits the history. Unconditionally
+    # computing MA200 on a shorter request produced an all-NaN column that
+    # made the final trim discard every row.
+    active = [w for w in (20, 50, 200) if n >= w]
+    close_mas = _rolling_means_shared(df["Close"].to_numpy(), tuple(active))
+    for w in (20, 50, 200):
+        df[f"MA{w}"] = close_mas[w] if w in close_mas else np.nan
+    df["RSI14"] = compute_rsi(df["Close"], 14)
+    df["ATR14"] = compute_atr(df["High"], df["Low"], df["Close"], 14)
+    df["ATR_PCT"] = df["ATR14"] / df["Close"]
+    df["VolAvg20"] = rolling_mean_nb(df["Volume"].to_numpy(), 20)
+    df["VolRatio20"] = df["Volume"] / df["VolAvg20"]
+    df["RET_5D"] = df["Close"].pct_change(5)
+    df["RET_20D"] = df["Close"].pct_change(20)
+    # Indicators are computed in float64 for accuracy but stored as float32:
+    # scoring only compares to ~3 significant digits.
+    for col in ("MA20", "MA50", "MA200", "RSI14", "ATR14", "ATR_PCT",
+                "VolAvg20", "VolRatio20", "RET_5D", "RET_20D"):
+        df[col] = df[col].astype(np.float32)
+    # The longest active MA dominates the warmup, so every computed
+    # indicator is valid from its first non-NaN row; an iloc slice returns
+    # a view where dropna had to copy every column into a fresh frame.
+    if not active:
+        return df.iloc[0:0]
+    valid = ~np.isnan(df[f"MA{max(active)}"].to_numpy(dtype=np.float64))
+    if not valid.any():
+        return df.iloc[0:0]
+    # RET_20D needs one more prior row than the 20-day windows.
+    start = max(int(np.argmax(valid)), 20)
+    return df.iloc[start:]
+
+
+def _parse_symbol_entry(ticker: str, entry) -> pd.DataFrame:
+    """Turn one symbol's time_series payload into an indicator DataFrame
+    (empty on error), caching good results."""
+    if not isinstance(entry, dict) or entry.get("status") == "error" or "values" not in entry:
+        msg = entry.get("message", entry) if isinstance(entry, dict) else entry
+        logger.warning("Twelve Data error for %s: %s", ticker, msg)
+        return pd.DataFrame()
+
+    values = entry["values"]
+    if len(values) < 60:
+        logger.warning("Not enough rows for %s: %d", ticker, len(values))
+        return pd.DataFrame()
+
+    return _add_indicators(_build_frame(values))
+
+
 def fetch_history(ticker: str, days: int = 365) -> pd.DataFrame:
-    cache_key = f"{ticker}_{days}"
-    if cache_key in _df_cache:
-        df, expires = _df_cache[cache_key]
-        if datetime.now() < expires:
-            print(f"[CACHE] hit {ticker}")
-            return df
-
-    outputsize = min(days, 5000)
+    cached = _cache_get(ticker, days)
+    if cached is not None:
+        logger.debug("cache hit %s", ticker)
+        return cached
+
     try:
         resp = _rate_limited_get(
             f"{_TWELVE_BASE}/time_series",
             params={
                 "symbol": ticker,
                 "interval": "1day",
-                "outputsize": outputsize,
+                "outputsize": min(days, 5000),
                 "apikey": TWELVE_DATA_API_KEY,
             },
         )
         data = resp.json()
     except Exception as e:
-        print(f"[WARN] Twelve Data request failed for {ticker}: {e}")
+        logger.warning("Twelve Data request failed for %s: %s", ticker, e)
         return pd.DataFrame()
 
-    if data.get("status") == "error" or "values" not in data:
-        print(f"[WARN] Twelve Data error for {ticker}: {data.get('message', data)}")
-        return pd.DataFrame()
-
-    values = data["values"]
-    if len(values) < 60:
-        print(f"[WARN] Not enough rows for {ticker}: {len(values)}")
-        return pd.DataFrame()
+    df = _parse_symbol_entry(ticker, data)
+    if not df.empty:
+        _cache_put(ticker, days, df)
+    return df
 
-    df = pd.DataFrame(values)
-    df["datetime"] = pd.to_datetime(df["datetime"])
-    df = df.sort_values("datetime").set_index("datetime")
-    for col in ["open", "high", "low", "close", "volume"]:
-        df[col] = pd.to_numeric(df[col], errors="coerce")
-    df = df.rename(columns={"open": "Open", "high": "High", "low": "Low", "close": "Close", "volume": "Volume"})
-    df = df.dropna(subset=["Close", "High", "Low", "Volume"])
 
-    df["MA20"] = df["Close"].rolling(20).mean()
-    df["MA50"] = df["Close"].rolling(50).mean()
-    df["MA200"] = df["Close"].rolling(200).mean()
-    df["RSI14"] = compute_rsi(df["Close"], 14)
-    df["ATR14"] = compute_atr(df["High"], df["Low"], df["Close"], 14)
-    df["ATR_PCT"] = df["ATR14"] / df["Close"]
-    df["VolAvg20"] = df["Volume"].rolling(20).mean()
-    df["VolRatio20"] = df["Volume"] / df["VolAvg20"]
-    df["RET_5D"] = df["Close"].pct_change(5)
-    df["RET_20D"] = df["Close"].pct_change(20)
-    df.dropna(inplace=True)
-    _df_cache[cache_key] = (df, datetime.now() + timedelta(seconds=_CACHE_TTL))
-    return df
+def fetch_history_bulk(tickers: List[str], days: int = 365) -> Dict[str, pd.DataFrame]:
+    """Fetch several symbols per round-trip via Twelve Data's multi-symbol
+    time_series. Each symbol still costs one API credit, so batches are
+    chunked to the per-minute budget; the win is one HTTPS round-trip per
+    chunk instead of one per symbol.
+
+    Returns a dict of ticker -> DataFrame (empty DataFrame when the API
+    rejected that symbol; ticker absent when the whole chunk request failed).
+    """
+    frames: Dict[str, pd.DataFrame] = {}
+    to_fetch: List[str] = []
+    for ticker in tickers:
+        cached = _cache_get(ticker, days)
+        if cached is not None:
+            frames[ticker] = cached
+        else:
+            to_fetch.append(ticker)
+
+    for i in range(0, len(to_fetch), _RATE_LIMIT):
+        chunk = to_fetch[i:i + _RATE_LIMIT]
+        try:
+            resp = _rate_limited_get(
+                f"{_TWELVE_BASE}/time_series",
+                params={
+                    "symbol": ",".join(chunk),
+                    "interval": "1day",
+                    "outputsize": min(days, 5000),
+                    "apikey": TWELVE_DATA_API_KEY,
+                },
+                credits=len(chunk),
+            )
+            data = resp.json()
+        except Exception as e:
+            logger.warning("Twelve Data bulk request failed for %s: %s", ",".join(chunk), e)
+            continue
+
+        # A single-symbol request comes back flat, not keyed by symbol.
+        if len(chunk) == 1 and "values" in data:
+            data = {chunk[0]: data}
+
+        for ticker in chunk:
+            df = _parse_symbol_entry(ticker, data.get(ticker))
+            if not df.empty:
+                _cache_put(ticker, days, df)
+            frames[ticker] = df
+    return frames
 
 
 # -----------------------------
 # Signal score
 # -----------------------------
 
-def compute_signal_score(row: pd.Series) -> Dict[str, Any]:
-    score = 0.0
-    tags: List[str] = []
-    notes: List[str] = []
-
-    close = row["Close"]
-    ma50 = row["MA50"]
-    ma200 = row["MA200"]
-    rsi = row["RSI14"]
-    vol_ratio = row["VolRatio20"]
-    atr_pct = row["ATR_PCT"]
-
-    if not math.isnan(ma50) and not math.isnan(ma200):
-        if close > ma50:
-            score += 15
+def score_batch(last: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Score the latest indicator row of many tickers in one pass.
+
+    Same contributions as the old per-row compute_signal_score, expressed
+    as predicated array arithmetic instead of Python branches; tags and
+    notes are assembled from the boolean masks at the end.
+    """
+    n = len(last)
+    close = last["Close"].to_numpy(dtype=np.float64)
+    ma50 = last["MA50"].to_numpy(dtype=np.float64)
+    ma200 = last["MA200"].to_numpy(dtype=np.float64)
+    rsi = last["RSI14"].to_numpy(dtype=np.float64)
+    vol_ratio = last["VolRatio20"].to_numpy(dtype=np.float64)
+    atr_pct = last["ATR_PCT"].to_numpy(dtype=np.float64)
+    ret_5d = last["RET_5D"].to_numpy(dtype=np.float64)
+    ret_20d = last["RET_20D"].to_numpy(dtype=np.float64)
+
+    score = np.zeros(n)
+
+    ma_ok = ~np.isnan(ma50) & ~np.isnan(ma200)
+    above50 = ma_ok & (close > ma50)
+    above200 = ma_ok & (close > ma200)
+    uptrend = above50 & (ma50 > ma200)
+    score += np.where(above50, 15.0, np.where(ma_ok, -10.0, 0.0))
+    score += np.where(above200, 15.0, np.where(ma_ok, -10.0, 0.0))
+    score += np.where(uptrend, 10.0, 0.0)
+
+    rsi_ok = ~np.isnan(rsi)
+    bullish = rsi_ok & (rsi >= 50) & (rsi <= 70)
+    building = rsi_ok & (rsi >= 40) & (rsi < 50)
+    overbought = rsi_ok & (rsi > 75)
+    oversold = rsi_ok & (rsi < 30)
+    score += np.where(bullish, 20.0, 0.0) + np.where(building, 10.0, 0.0)
+    score -= np.where(overbought, 10.0, 0.0) + np.where(oversold, 15.0, 0.0)
+
+    score += np.where(~np.isnan(ret_5d), np.clip(ret_5d * 100, -10, 10), 0.0)
+    score += np.where(~np.isnan(ret_20d), np.clip(ret_20d * 50, -15, 15), 0.0)
+
+    vol_ok = ~np.isnan(vol_ratio)
+    high_vol = vol_ok & (vol_ratio > 1.5)
+    low_vol = vol_ok & (vol_ratio < 0.7)
+    score += np.where(high_vol, 10.0, 0.0) - np.where(low_vol, 5.0, 0.0)
+
+    atr_ok = ~np.isnan(atr_pct)
+    tradable = atr_ok & (atr_pct >= 0.015) & (atr_pct <= 0.05)
+    very_volatile = atr_ok & (atr_pct > 0.08)
+    very_quiet = atr_ok & (atr_pct < 0.01)
+    score += np.where(tradable, 10.0, 0.0) - np.where(very_volatile, 10.0, 0.0) - np.where(very_quiet, 5.0, 0.0)
+
+    out: List[Dict[str, Any]] = []
+    for i in range(n):
+        tags: List[str] = []
+        if above50[i]:
             tags.append("Above MA50")
-        else:
-            score -= 10
-        if close > ma200:
-            score += 15
+        if above200[i]:
             tags.append("Above MA200")
-        else:
-            score -= 10
-        if close > ma50 > ma200:
-            score += 10
+        if uptrend[i]:
             tags.append("Strong Uptrend")
-
-    if not math.isnan(rsi):
-        if 50 <= rsi <= 70:
-            score += 20
+        if bullish[i]:
             tags.append("Bullish Momentum")
-        elif 40 <= rsi < 50:
-            score += 10
+        elif building[i]:
             tags.append("Building Momentum")
-        elif rsi > 75:
-            score -= 10
+        elif overbought[i]:
             tags.append("Overbought")
-        elif rsi < 30:
-            score -= 15
+        elif oversold[i]:
             tags.append("Oversold")
-
-    ret_5d = row.get("RET_5D", np.nan)
-    ret_20d = row.get("RET_20D", np.nan)
-    if not math.isnan(ret_5d):
-        score += max(min(ret_5d * 100, 10), -10)
-    if not math.isnan(ret_20d):
-        score += max(min(ret_20d * 50, 15), -15)
-
-    if not math.isnan(vol_ratio):
-        if vol_ratio > 1.5:
-            score += 10
+        if high_vol[i]:
             tags.append("High Volume")
-        elif vol_ratio < 0.7:
-            score -= 5
+        elif low_vol[i]:
             tags.append("Low Volume")
-
-    if not math.isnan(atr_pct):
-        if 0.015 <= atr_pct <= 0.05:
-            score += 10
+        if tradable[i]:
             tags.append("Tradable Volatility")
-        elif atr_pct > 0.08:
-            score -= 10
+        elif very_volatile[i]:
             tags.append("Very Volatile")
-        elif atr_pct < 0.01:
-            score -= 5
+        elif very_quiet[i]:
             tags.append("Very Quiet")
-
-    notes.append(f"RSI={rsi:.1f}" if not math.isnan(rsi) else "RSI=n/a")
-    notes.append(f"Vol xAvg={vol_ratio:.2f}" if not math.isnan(vol_ratio) else "Vol xAvg=n/a")
-    notes.append(f"ATR%={atr_pct*100:.2f}%" if not math.isnan(atr_pct) else "ATR%=n/a")
-
-    return {"score": round(score, 1), "tags": tags, "notes": "; ".join(notes)}
+        notes = [
+            f"RSI={rsi[i]:.1f}" if rsi_ok[i] else "RSI=n/a",
+            f"Vol xAvg={vol_ratio[i]:.2f}" if vol_ok[i] else "Vol xAvg=n/a",
+            f"ATR%={atr_pct[i]*100:.2f}%" if atr_ok[i] else "ATR%=n/a",
+        ]
+        out.append({"score": round(float(score[i]), 1), "tags": tags, "notes": "; ".join(notes)})
+    return out
 
 
 # -----------------------------
@@ -213,39 +447,63 @@ DEFAULT_TICKERS = [
 ]
 
 
-def analyze_ticker(ticker: str, days: int = 365) -> Optional[Dict[str, Any]]:
-    try:
-        df = fetch_history(ticker, days)
-        if df.empty:
-            return None
-        last = df.iloc[-1]
-        sig = compute_signal_score(last)
-        return {
+# Column layout shared by score_batch input and the result metrics.
+_SCORE_COLUMNS = ["Close", "MA20", "MA50", "MA200", "RSI14", "VolRatio20", "ATR_PCT", "RET_5D", "RET_20D"]
+_METRIC_IDX = [_SCORE_COLUMNS.index(c) for c in ("Close", "RSI14", "VolRatio20", "ATR_PCT", "RET_5D", "RET_20D")]
+
+
+def _results_from_frames(frames: Dict[str, pd.DataFrame]) -> List[Dict[str, Any]]:
+    valid = {t: df for t, df in frames.items() if df is not None and not df.empty}
+    if not valid:
+        return []
+    # Positional one-row slices instead of df.iloc[-1], which materializes a
+    # full labelled Series per ticker.
+    rows = np.vstack([df.iloc[-1:][_SCORE_COLUMNS].to_numpy(dtype=np.float64) for df in valid.values()])
+    sigs = score_batch(pd.DataFrame(rows, columns=_SCORE_COLUMNS, index=list(valid)))
+    metrics = rows[:, _METRIC_IDX]
+    return [
+        {
             "ticker": ticker,
-            "close": float(last["Close"]),
-            "rsi": float(last["RSI14"]),
-            "vol_ratio": float(last["VolRatio20"]),
-            "atr_pct": float(last["ATR_PCT"]),
-            "ret_5d": float(last["RET_5D"]),
-            "ret_20d": float(last["RET_20D"]),
-            "score": sig["score"],
-            "tags": sig["tags"],
-            "notes": sig["notes"],
+            "close": float(row[0]),
+            "rsi": float(row[1]),
+            "vol_ratio": float(row[2]),
+            "atr_pct": float(row[3]),
+            "ret_5d": float(row[4]),
+            "ret_20d": float(row[5]),
+            **sig,
         }
+        for ticker, row, sig in zip(valid, metrics, sigs)
+    ]
+
+
+def analyze_ticker(ticker: str, days: int = 365, df: Optional[pd.DataFrame] = None) -> Optional[Dict[str, Any]]:
+    try:
+        if df is None:
+            df = fetch_history(ticker, days)
+        results = _results_from_frames({ticker: df})
+        return results[0] if results else None
     except Exception as e:
-        print(f"[WARN] Failed for {ticker}: {e}")
+        logger.warning("Failed for %s: %s", ticker, e)
         return None
 
 
-def run_screener(tickers: List[str], days: int = 365, limit: int = 15) -> List[Dict[str, Any]]:
-    results = []
-    for t in tickers:
-        print(f"Analyzing {t} ...")
-        res = analyze_ticker(t, days)
-        if res is not None:
-            results.append(res)
-    results.sort(key=lambda x: x["score"], reverse=True)
-    return results[:limit]
+def run_screener(tickers: List[str], days: int = 365, limit: int = 15, max_workers: int = 8) -> List[Dict[str, Any]]:
+    frames = fetch_history_bulk(tickers, days)
+    # Tickers missing from the bulk result (whole-chunk failures) fall back
+    # to parallel single fetches.
+    missing = [t for t in tickers if t not in frames]
+    if missing:
+        workers = max(1, min(max_workers, len(missing)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for ticker, df in zip(missing, executor.map(lambda t: fetch_history(t, days), missing)):
+                frames[ticker] = df
+    try:
+        results = _results_from_frames(frames)
+    except Exception as e:
+        logger.warning("scoring failed: %s", e)
+        return []
+    # Top-K selection: only a limit-sized heap instead of sorting all N.
+    return heapq.nlargest(limit, results, key=lambda x: x["score"])
 
 
 # -----------------------------
@@ -257,13 +515,15 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--tickers", type=str, default=None)
     parser.add_argument("--days", type=int, default=365)
     parser.add_argument("--limit", type=int, default=15)
+    parser.add_argument("--max-workers", type=int, default=8)
     return parser.parse_args()
 
 
 def main() -> None:
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
     args = parse_args()
     tickers = [t.strip().upper() for t in args.tickers.split(",")] if args.tickers else DEFAULT_TICKERS
-    results = run_screener(tickers=tickers, days=args.days, limit=args.limit)
+    results = run_screener(tickers=tickers, days=args.days, limit=args.limit, max_workers=args.max_workers)
     if not results:
         print("No results.")
         return
@@ -1,23 +1,33 @@
+import asyncio
 import os
-from typing import List, Optional
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
 
 from fastapi import FastAPI, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
-from signalradar import run_screener, DEFAULT_TICKERS, fetch_history, _session, _rate_limited_get
+from signalradar import (
+    run_screener, DEFAULT_TICKERS, fetch_history, fetch_history_bulk,
+    _build_frame, _session, _rate_limited_get, _TWELVE_BASE, TWELVE_DATA_API_KEY,
+)
 from database import (
     init_db, save_snapshots, get_score_history,
     get_watchlist, add_to_watchlist, remove_from_watchlist,
 )
 
-TWELVE_DATA_API_KEY = os.getenv("TWELVE_DATA_API_KEY", "")
-_TWELVE_BASE = "https://api.twelvedata.com"
+# Route our messages through uvicorn's configured handlers in the server
+# process.
+logger = logging.getLogger("uvicorn.error")
 
 app = FastAPI(
     title="SignalRadar API",
     description="Momentum & signal screener for stocks",
     version="0.4.0",
+    default_response_class=ORJSONResponse,
 )
 
 _raw_origins = os.getenv("ALLOWED_ORIGINS", "*")
@@ -32,9 +42,59 @@ app.add_middleware(
 )
 
 
+# Cache for /history responses: (symbol, days) -> (points, expires_at)
+_history_cache: Dict[tuple, tuple] = {}
+_history_lock = threading.Lock()
+_HISTORY_TTL = 600  # 10 minutes
+
+
+# Pre-scored default-universe signals maintained by the background
+# refresher; /signals serves these directly for the default path.
+_REFRESH_INTERVAL = 900  # 15 minutes
+_default_signals: List[dict] = []
+_default_signals_lock = threading.Lock()
+_refresh_task: Optional[asyncio.Task] = None  # keep a ref so the task isn't GC'd
+
+
+def _persist_results(results: List[dict]) -> None:
+    try:
+        snapshot_ids = save_snapshots(results)
+        if snapshot_ids:
+            try:
+                from rag_agent import embed_and_store_snapshots
+                embed_and_store_snapshots(results, snapshot_ids)
+            except Exception as e:
+                logger.warning("RAG embedding pipeline failed: %s", e)
+    except Exception as e:
+        logger.warning("save_snapshots failed: %s", e)
+
+
+def _refresh_default_signals() -> None:
+    results = run_screener(tickers=DEFAULT_TICKERS, days=365, limit=100)
+    if results:
+        with _default_signals_lock:
+            _default_signals[:] = results
+        _persist_results(results)
+    logger.info("default signals refreshed (%d rows)", len(results))
+
+
+async def _refresh_loop() -> None:
+    loop = asyncio.get_running_loop()
+    while True:
+        try:
+            await loop.run_in_executor(None, _refresh_default_signals)
+        except Exception as e:
+            logger.warning("signal refresh failed: %s", e)
+        await asyncio.sleep(_REFRESH_INTERVAL)
+
+
 @app.on_event("startup")
-def on_startup():
+async def on_startup():
+    global _refresh_task
     init_db()
+    # The refresher's first pass doubles as cache warmup, so requests for
+    # the default universe never pay fetch latency.
+    _refresh_task = asyncio.create_task(_refresh_loop())
 
 
 @app.get("/signals")
@@ -42,24 +102,24 @@ def get_signals(
     tickers: Optional[str] = Query(None, description="Comma-separated tickers. Omit for default large caps."),
     days: int = Query(365, ge=60, le=2000),
     limit: int = Query(15, ge=1, le=100),
+    max_workers: int = Query(8, ge=1, le=32),
 ):
     tickers_list: List[str] = (
         [t.strip().upper() for t in tickers.split(",") if t.strip()]
         if tickers
         else DEFAULT_TICKERS
     )
-    results = run_screener(tickers=tickers_list, days=days, limit=limit)
+    # Default-universe requests are served from the pre-scored snapshot the
+    # refresher maintains (already persisted there); custom requests take
+    # the live path.
+    if not tickers and days == 365:
+        with _default_signals_lock:
+            cached = _default_signals[:limit]
+        if cached:
+            return {"count": len(cached), "tickers": tickers_list, "days": days, "limit": limit, "results": cached}
+    results = run_screener(tickers=tickers_list, days=days, limit=limit, max_workers=max_workers)
     if results:
-        try:
-            snapshot_ids = save_snapshots(results)
-            if snapshot_ids:
-                try:
-                    from rag_agent import embed_and_store_snapshots
-                    embed_and_store_snapshots(results, snapshot_ids)
-                except Exception as e:
-                    print(f"[RAG] embedding pipeline failed: {e}")
-        except Exception as e:
-            print(f"[DB] save_snapshots failed: {e}")
+        _persist_results(results)
     return {"count": len(results), "tickers": tickers_list, "days": days, "limit": limit, "results": results}
 
 
@@ -108,6 +168,13 @@ def get_history(
     days: int = Query(120, ge=30, le=730),
 ):
     symbol = ticker.upper()
+    with _history_lock:
+        entry = _history_cache.get((symbol, days))
+    if entry is not None:
+        points, expires = entry
+        if datetime.now() < expires:
+            return {"ticker": symbol, "days": days, "points": points}
+
     try:
         resp = _rate_limited_get(
             f"{_TWELVE_BASE}/time_series",
@@ -120,14 +187,20 @@ def get_history(
         )
         data = resp.json()
     except Exception as e:
-        print(f"[WARN] history error for {symbol}: {e}")
+        logger.warning("history error for %s: %s", symbol, e)
         return {"ticker": symbol, "days": days, "points": []}
 
     if data.get("status") == "error" or "values" not in data:
         return {"ticker": symbol, "days": days, "points": []}
 
-    values = sorted(data["values"], key=lambda x: x["datetime"])
-    points = [{"date": v["datetime"][:10], "close": float(v["close"])} for v in values[-60:]]
+    # Shared parser sorts and coerces once; zipping the arrays avoids any
+    # per-row conversion.
+    df_tail = _build_frame(data["values"]).tail(60)
+    dates = df_tail.index.strftime("%Y-%m-%d").tolist()
+    closes = df_tail["Close"].to_numpy(dtype=float).tolist()
+    points = [{"date": d, "close": c} for d, c in zip(dates, closes)]
+    with _history_lock:
+        _history_cache[(symbol, days)] = (points, datetime.now() + timedelta(seconds=_HISTORY_TTL))
     return {"ticker": symbol, "days": days, "points": points}
 
 